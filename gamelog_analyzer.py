@@ -1,3 +1,5 @@
+import re
+from itertools import accumulate
 import matplotlib.pyplot as plt
 from statistics import mean, stdev
 
@@ -18,26 +20,18 @@ def AnalyzeGame():
     with open(log_file_name, 'r') as f:
         log = f.read()
         
-    log_game, log_final = log.split('Final')[0], log.split('Final')[1]
-    log_rounds = log_game.split('#')[1:]
+    # the engine logs '<name> awarded <delta>' for both players at the end of
+    # each round; anchor on the exact names so bot-controlled text (e.g. a
+    # misformatted response echoed into the log) can never match
+    award_line = re.compile(rf'^({re.escape(P1)}|{re.escape(P2)}) awarded (-?\d+)$', re.MULTILINE)
+    PnL = {P1: [], P2: []}
+    for match in award_line.finditer(log):
+        PnL[match.group(1)].append(int(match.group(2)))
+    P1_PnL, P2_PnL = PnL[P1], PnL[P2]
+    assert len(P1_PnL) == len(P2_PnL)  # one award line per player per round
     
-    P1_bankroll, P1_PnL = [0], []
-    P2_bankroll, P2_PnL = [0], []
-    
-    for round_x in log_rounds:
-        for line_x in round_x.split('\n'):
-            if 'awarded' in line_x:
-                if P1 in line_x:
-                    p1_pnl = int(line_x.split('awarded ')[-1])
-                if P2 in line_x:
-                    p2_pnl = int(line_x.split('awarded ')[-1])
-        
-        P1_bankroll.append(P1_bankroll[-1] + p1_pnl)
-        P1_PnL.append(p1_pnl)
-        
-        P2_bankroll.append(P2_bankroll[-1] + p2_pnl)
-        P2_PnL.append(p2_pnl)
-        
+    P1_bankroll = list(accumulate(P1_PnL, initial=0))
+    P2_bankroll = list(accumulate(P2_PnL, initial=0))
     
     mean_win_p1 = mean(P1_PnL)
     std_win_p1 = stdev(P1_PnL)